@@ -3,87 +3,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
 from typing import Final
 
 from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
     BluetoothServiceInfoBleak,
-    async_ble_device_from_address,
+    async_register_callback,
 )
-from bleak import BLEDevice
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
 
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
 from .const import DOMAIN
+from .helpers import get_ble_device_with_adapter
+from .services import async_register_services, async_unregister_services
 
 PLATFORMS: Final = [Platform.BUTTON, Platform.CLIMATE]
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_ble_device_with_adapter(
-    hass: HomeAssistant, address: str, entry_id: str | None = None
-) -> BLEDevice | None:
-    """
-    Get BLE device reference, preferring the adapter used during initial setup.
-    
-    This helps prevent disconnections when multiple Bluetooth adapters are available
-    by ensuring we use the same adapter that was used during setup.
-    
-    Args:
-        hass: Home Assistant instance
-        address: MAC address of the device
-        entry_id: Config entry ID to look up stored adapter preference
-        
-    Returns:
-        BLEDevice if found, None otherwise
-    """
-    ble_device = async_ble_device_from_address(hass, address, connectable=True)
-    
-    if not ble_device:
-        return None
-    
-    # If we have an entry_id, check if we should prefer a specific adapter
-    if entry_id and entry_id in hass.data.get(DOMAIN, {}):
-        preferred_adapter = hass.data[DOMAIN][entry_id].get("adapter_source")
-        if preferred_adapter:
-            device_adapter = ble_device.details.get("source")
-            if device_adapter != preferred_adapter:
-                _LOGGER.warning(
-                    "Device %s found on adapter %s, but preferred adapter is %s. "
-                    "This may cause connection issues. Using current adapter.",
-                    address,
-                    device_adapter,
-                    preferred_adapter,
-                )
-            else:
-                _LOGGER.debug(
-                    "Device %s found on preferred adapter: %s",
-                    address,
-                    device_adapter,
-                )
-        else:
-            # Store the adapter if we haven't stored it yet
-            device_adapter = ble_device.details.get("source")
-            hass.data[DOMAIN][entry_id]["adapter_source"] = device_adapter
-            _LOGGER.info(
-                "Storing adapter %s for device %s (entry_id: %s)",
-                device_adapter,
-                address,
-                entry_id,
-            )
-    else:
-        # Log which adapter we're using
-        device_adapter = ble_device.details.get("source")
-        _LOGGER.debug(
-            "Device %s found on adapter: %s",
-            address,
-            device_adapter,
-        )
-    
-    return ble_device
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MicroAirEasyTouch from a config entry."""
     address = entry.unique_id
@@ -92,29 +33,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     email = entry.data.get(CONF_USERNAME)
     data = MicroAirEasyTouchBluetoothDeviceData(password=password, email=email)
 
-    # Get initial BLE device to determine which adapter to use
-    ble_device = async_ble_device_from_address(hass, address, connectable=True)
-    adapter_source = None
-    if ble_device:
-        adapter_source = ble_device.details.get("source")
-        _LOGGER.info(
-            "MicroAirEasyTouch %s will use adapter: %s",
-            address,
-            adapter_source,
-        )
-    else:
-        _LOGGER.warning(
-            "MicroAirEasyTouch %s not found during setup, adapter will be determined on first connection",
-            address,
-        )
-
     # Create a per-device lock to serialize BLE operations
     # This prevents concurrent operations when multiple entities (zones) access the same device
     ble_lock = asyncio.Lock()
     
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data._entry_data = {
         "data": data,
-        "adapter_source": adapter_source,
+        "adapter_source": None,
         "ble_lock": ble_lock,
     }
     
@@ -124,20 +49,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.entry_id,
     )
 
+    # Look up the device once to record which adapter to use
+    if not get_ble_device_with_adapter(hass, address, data._entry_data):
+        _LOGGER.warning(
+            "MicroAirEasyTouch %s not found during setup, adapter will be determined on first connection",
+            address,
+        )
+
     @callback
-    def _handle_bluetooth_update(service_info: BluetoothServiceInfoBleak) -> None:
+    def _handle_bluetooth_update(
+        service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
         """Update device info from advertisements."""
-        if service_info.address == address:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Received BLE advertisement from %s", address)
-            data._start_update(service_info)
-            # Note: We don't trigger state updates from advertisements to avoid
-            # overwhelming the device with connection attempts. State updates
-            # happen via polling (SCAN_INTERVAL) and immediately after commands.
+        data._start_update(service_info)
+        # Note: We don't trigger state updates from advertisements to avoid
+        # overwhelming the device with connection attempts. State updates
+        # happen via polling (SCAN_INTERVAL) and immediately after commands.
 
-    hass.bus.async_listen("bluetooth_service_info", _handle_bluetooth_update)
+    # The matcher makes the bluetooth manager dispatch only this device's advertisements
+    entry.async_on_unload(
+        async_register_callback(
+            hass,
+            _handle_bluetooth_update,
+            BluetoothCallbackMatcher(address=address),
+            BluetoothScanningMode.PASSIVE,
+        )
+    )
 
-    # Register services (import here to avoid circular import)
-    from .services import async_register_services
     await async_register_services(hass)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -146,8 +86,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-        # Unregister services (import here to avoid circular import)
-        from .services import async_unregister_services
-        await async_unregister_services(hass)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Commands leave the connection open for a while, close it now
+        await entry_data["data"].disconnect()
+        # Services are shared by all entries, keep them until the last one is unloaded
+        if not any(
+            other.entry_id in hass.data[DOMAIN]
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            await async_unregister_services(hass)
     return unload_ok
\ No newline at end of file
@@ -1,10 +1,9 @@
 """Support for MicroAirEasyTouch climate control."""
 from __future__ import annotations
 
-import asyncio
 import logging
-import json
 import time
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -17,13 +16,14 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
-from . import get_ble_device_with_adapter
+from .helpers import get_ble_device_with_adapter
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
 from .micro_air_easytouch.const import (
     UUIDS,
@@ -36,6 +36,81 @@ from .micro_air_easytouch.const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll more frequently for better responsiveness (15 seconds)
+# State changes are also shown as soon as a command is accepted
+SCAN_INTERVAL = timedelta(seconds=15)
+
+# Collect changes made in quick succession (e.g. dragging a slider) into one command
+_COMMAND_COALESCE_DELAY = 0.3
+
+# Change command keys and the state keys they set
+_CHANGE_TO_STATE_KEY = {
+    "cool_sp": "cool_sp",
+    "heat_sp": "heat_sp",
+    "dry_sp": "dry_sp",
+    "autoCool_sp": "autoCool_sp",
+    "autoHeat_sp": "autoHeat_sp",
+    "fanOnly": "fan_mode_num",
+    "coolFan": "cool_fan_mode_num",
+    "heatFan": "heat_fan_mode_num",
+    "autoFan": "auto_fan_mode_num",
+}
+
+# Map device fan modes to Home Assistant standard names
+_FAN_MODE_MAP = {
+    "off": "off",
+    "low": "low",
+    "manualL": "low",
+    "cycledL": "low",
+    "high": "high",
+    "manualH": "high",
+    "cycledH": "high",
+    "full auto": "auto",
+}
+
+# State key holding the fan setting of each hvac mode, its default value and
+# the Home Assistant fan mode reported for unknown values
+_FAN_KEY_BY_MODE = {
+    HVACMode.FAN_ONLY: ("fan_mode_num", 0, "off"),
+    HVACMode.COOL: ("cool_fan_mode_num", 128, "auto"),
+    HVACMode.HEAT: ("heat_fan_mode_num", 128, "auto"),
+    HVACMode.AUTO: ("auto_fan_mode_num", 128, "auto"),
+}
+
+# (hvac mode, device fan value) -> Home Assistant fan mode
+_FAN_COMPOSITE = {
+    (HVACMode.FAN_ONLY, num): _FAN_MODE_MAP[name] for name, num in FAN_MODES_FAN_ONLY.items()
+}
+_FAN_COMPOSITE.update(
+    {
+        (hvac_mode, num): _FAN_MODE_MAP[name]
+        for hvac_mode in (HVACMode.COOL, HVACMode.HEAT, HVACMode.AUTO)
+        for num, name in FAN_MODES_REVERSE.items()
+    }
+)
+
+# Map our modes to Home Assistant fan icons
+_FAN_MODE_ICONS = {
+    "off": "mdi:fan-off",
+    "low": "mdi:fan-speed-1",
+    "high": "mdi:fan-speed-3",
+    "manualL": "mdi:fan-speed-1",
+    "manualH": "mdi:fan-speed-3",
+    "cycledL": "mdi:fan-clock",
+    "cycledH": "mdi:fan-clock",
+    "full auto": "mdi:fan-auto",
+}
+
+# Map HVAC modes to icons
+_HVAC_MODE_ICONS = {
+    HVACMode.OFF: "mdi:power",
+    HVACMode.HEAT: "mdi:fire",
+    HVACMode.COOL: "mdi:snowflake",
+    HVACMode.AUTO: "mdi:autorenew",
+    HVACMode.FAN_ONLY: "mdi:fan",
+    HVACMode.DRY: "mdi:water-percent",
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -43,7 +118,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up MicroAirEasyTouch climate platform."""
     data = hass.data[DOMAIN][config_entry.entry_id]["data"]
-    entity = MicroAirEasyTouchClimate(data, config_entry.unique_id, config_entry.entry_id)
+    entity = MicroAirEasyTouchClimate(data, config_entry.unique_id)
     async_add_entities([entity])
 
 class MicroAirEasyTouchClimate(ClimateEntity):
@@ -58,43 +133,7 @@ class MicroAirEasyTouchClimate(ClimateEntity):
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
     _attr_hvac_modes = list(HA_MODE_TO_EASY_MODE.keys())
     _attr_should_poll = True
-    # Poll more frequently for better responsiveness (15 seconds)
-    # State changes also update immediately after commands
-    SCAN_INTERVAL = 15
-
-    # Map our modes to Home Assistant fan icons
-    _FAN_MODE_ICONS = {
-        "off": "mdi:fan-off",
-        "low": "mdi:fan-speed-1",
-        "high": "mdi:fan-speed-3",
-        "manualL": "mdi:fan-speed-1",
-        "manualH": "mdi:fan-speed-3",
-        "cycledL": "mdi:fan-clock",
-        "cycledH": "mdi:fan-clock",
-        "full auto": "mdi:fan-auto",
-    }
-
-    # Map HVAC modes to icons
-    _HVAC_MODE_ICONS = {
-        HVACMode.OFF: "mdi:power",
-        HVACMode.HEAT: "mdi:fire",
-        HVACMode.COOL: "mdi:snowflake",
-        HVACMode.AUTO: "mdi:autorenew",
-        HVACMode.FAN_ONLY: "mdi:fan",
-        HVACMode.DRY: "mdi:water-percent",
-    }
 
-    # Map device fan modes to Home Assistant standard names
-    _FAN_MODE_MAP = {
-        "off": "off",
-        "low": "low",
-        "manualL": "low",
-        "cycledL": "low",
-        "high": "high",
-        "manualH": "high",
-        "cycledH": "high",
-        "full auto": "auto",
-    }
     _FAN_MODE_REVERSE_MAP = {
         "off": [0],
         "low": [1, 65],
@@ -102,11 +141,10 @@ class MicroAirEasyTouchClimate(ClimateEntity):
         "auto": [128],
     }
 
-    def __init__(self, data: MicroAirEasyTouchBluetoothDeviceData, mac_address: str, entry_id: str) -> None:
+    def __init__(self, data: MicroAirEasyTouchBluetoothDeviceData, mac_address: str) -> None:
         """Initialize the climate."""
         self._data = data
         self._mac_address = mac_address
-        self._entry_id = entry_id
         self._attr_unique_id = f"microaireasytouch_{mac_address}_climate"
         self._attr_name = "EasyTouch Climate"
         self._attr_device_info = DeviceInfo(
@@ -116,46 +154,64 @@ class MicroAirEasyTouchClimate(ClimateEntity):
             model="Thermostat",
         )
         self._state = {}
-
-    @property
-    def icon(self) -> str:
-        """Return the entity icon."""
-        return self._HVAC_MODE_ICONS.get(self.hvac_mode, "mdi:thermostat")
-
-    @property
-    def entity_picture(self) -> str | None:
-        """Return the entity picture."""
-        if self.fan_mode:
-            return f"mdi:{self._FAN_MODE_ICONS.get(self.fan_mode, 'fan')}"
-        return None
+        # Only the timestamp of a status request changes between polls
+        self._status_message = {"Type": "Get Status", "Zone": 0, "EM": data._email}
+        self._pending_changes: dict[str, Any] = {}
+        # Changes being sent, until the device accepts them into the local state
+        self._sending_changes: dict[str, Any] = {}
+        self._flush_unsub: CALLBACK_TYPE | None = None
+        self._cached_hvac_mode: HVACMode | None = None
+        # (target, high, low) setpoints for the cached hvac mode
+        self._target_temps: tuple[float | None, float | None, float | None] = (None, None, None)
+        self._cached_fan_mode: str | None = None
+        self._fan_icon = "mdi:fan"
+        self._apply_state({})
+
+    def _apply_state(self, state: dict[str, Any]) -> None:
+        """Store a new device state and refresh the values derived from it."""
+        self._state = state
+        self._cached_hvac_mode = mode = self._compute_hvac_mode()
+        self._cached_fan_mode = fan_mode = self._compute_fan_mode()
+        self._attr_icon = _HVAC_MODE_ICONS.get(mode, "mdi:thermostat")
+        self._fan_icon = _FAN_MODE_ICONS.get(fan_mode, "mdi:fan")
+        self._attr_entity_picture = f"mdi:{_FAN_MODE_ICONS.get(fan_mode, 'fan')}" if fan_mode else None
+        if mode == HVACMode.COOL:
+            self._target_temps = (state.get("cool_sp"), None, None)
+        elif mode == HVACMode.HEAT:
+            self._target_temps = (state.get("heat_sp"), None, None)
+        elif mode == HVACMode.DRY:
+            self._target_temps = (state.get("dry_sp"), None, None)
+        elif mode == HVACMode.AUTO:
+            self._target_temps = (None, state.get("autoCool_sp"), state.get("autoHeat_sp"))
+        else:
+            self._target_temps = (None, None, None)
 
     @property
     def current_fan_icon(self) -> str:
         """Return the icon to use for the current fan mode."""
-        return self._FAN_MODE_ICONS.get(self.fan_mode, "mdi:fan")
+        return self._fan_icon
 
     async def _async_fetch_initial_state(self) -> None:
         """Fetch the initial state from the device."""
-        ble_device = get_ble_device_with_adapter(self.hass, self._mac_address, self._entry_id)
+        ble_device = get_ble_device_with_adapter(self.hass, self._mac_address, self._data._entry_data)
         if not ble_device:
             _LOGGER.error("Could not find BLE device: %s", self._mac_address)
-            self._state = {}
+            self._apply_state({})
             return
 
         # Get the BLE lock to serialize operations
-        ble_lock = None
-        if self._entry_id in self.hass.data.get(DOMAIN, {}):
-            ble_lock = self.hass.data[DOMAIN][self._entry_id].get("ble_lock")
+        ble_lock = self._data._entry_data["ble_lock"]
 
-        message = {"Type": "Get Status", "Zone": 0, "EM": self._data._email, "TM": int(time.time())}
+        message = {**self._status_message, "TM": int(time.time())}
         try:
             # Use combined send+read to avoid double connection (much faster)
             json_payload = await self._data.send_command_and_read(
                 self.hass, ble_device, message, UUIDS["jsonReturn"], ble_lock
             )
             if json_payload:
-                self._state = self._data.decrypt(json_payload.decode('utf-8'))
-                _LOGGER.debug("Initial state fetched: %s", self._state)
+                self._apply_state(self._data.decrypt(json_payload))
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Initial state fetched: %s", self._state)
                 self.async_write_ha_state()
             else:
                 # Preserve last known state instead of clearing it
@@ -177,70 +233,48 @@ class MicroAirEasyTouchClimate(ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        if self.hvac_mode == HVACMode.COOL:
-            return self._state.get("cool_sp")
-        elif self.hvac_mode == HVACMode.HEAT:
-            return self._state.get("heat_sp")
-        elif self.hvac_mode == HVACMode.DRY:
-            return self._state.get("dry_sp")
-        return None
+        return self._target_temps[0]
 
     @property
     def target_temperature_high(self) -> float | None:
         """Return the high target temperature."""
-        if self.hvac_mode == HVACMode.AUTO:
-            return self._state.get("autoCool_sp")
-        return None
+        return self._target_temps[1]
 
     @property
     def target_temperature_low(self) -> float | None:
         """Return the low target temperature."""
-        if self.hvac_mode == HVACMode.AUTO:
-            return self._state.get("autoHeat_sp")
-        return None
+        return self._target_temps[2]
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation mode."""
+        return self._cached_hvac_mode or HVACMode.OFF
+
+    def _compute_hvac_mode(self) -> HVACMode:
+        """Derive the hvac operation mode from the device state."""
         # Check current_mode_num first - this is what the device is actually doing
         # mode_num is the setpoint (what mode is configured), but current_mode_num is the actual state
         current_mode_num = self._state.get("current_mode_num", 0)
-        mode_num = self._state.get("mode_num", 0)
-        current_mode = self._state.get("current_mode")
-        off_flag = self._state.get("off")
-        on_flag = self._state.get("on")
-        
-        # Debug logging to help diagnose power state detection
-        _LOGGER.debug(
-            "hvac_mode check: current_mode_num=%s, mode_num=%s, current_mode=%s, off=%s, on=%s",
-            current_mode_num, mode_num, current_mode, off_flag, on_flag
-        )
-        
+
         # If current_mode_num is 0, device is actually off regardless of mode_num
         if current_mode_num == 0:
-            _LOGGER.debug("Device is OFF (current_mode_num=0)")
             return HVACMode.OFF
-        
+
         # Check if device is powered off via param flags
-        if off_flag is True:
-            _LOGGER.debug("Device is OFF (off flag=True)")
+        if self._state.get("off") is True:
             return HVACMode.OFF
-        
+
         # If 'on' flag is explicitly False, device is off
-        if on_flag is False:
-            _LOGGER.debug("Device is OFF (on flag=False)")
+        if self._state.get("on") is False:
             return HVACMode.OFF
-        
+
         # If current_mode is "off", device is off
-        if current_mode == "off":
-            _LOGGER.debug("Device is OFF (current_mode='off')")
+        if self._state.get("current_mode") == "off":
             return HVACMode.OFF
-        
+
         # Otherwise, use mode_num (the configured/set mode)
         # This represents what mode the user has selected, even if currently idle
-        result = EASY_MODE_TO_HA_MODE.get(mode_num, HVACMode.OFF)
-        _LOGGER.debug("Device mode: %s (from mode_num=%s)", result, mode_num)
-        return result
+        return EASY_MODE_TO_HA_MODE.get(self._state.get("mode_num", 0), HVACMode.OFF)
 
     @property
     def hvac_action(self) -> HVACAction | None:
@@ -272,21 +306,16 @@ class MicroAirEasyTouchClimate(ClimateEntity):
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode as a standard Home Assistant name."""
-        if self.hvac_mode == HVACMode.FAN_ONLY:
-            fan_mode_num = self._state.get("fan_mode_num", 0)
-            mode = FAN_MODES_FAN_ONLY.get(fan_mode_num, "off")
-        elif self.hvac_mode == HVACMode.COOL:
-            fan_mode_num = self._state.get("cool_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        elif self.hvac_mode == HVACMode.HEAT:
-            fan_mode_num = self._state.get("heat_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        elif self.hvac_mode == HVACMode.AUTO:
-            fan_mode_num = self._state.get("auto_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        else:
-            mode = "full auto"
-        return self._FAN_MODE_MAP.get(mode, "auto")
+        return self._cached_fan_mode
+
+    def _compute_fan_mode(self) -> str:
+        """Derive the Home Assistant fan mode from the device state."""
+        hvac_mode = self.hvac_mode
+        fan_key = _FAN_KEY_BY_MODE.get(hvac_mode)
+        if fan_key is None:
+            return "auto"
+        key, default, fallback = fan_key
+        return _FAN_COMPOSITE.get((hvac_mode, self._state.get(key, default)), fallback)
 
     @property
     def fan_modes(self) -> list[str]:
@@ -295,83 +324,52 @@ class MicroAirEasyTouchClimate(ClimateEntity):
             return ["off", "low", "high"]
         return ["off", "low", "high", "auto"]
 
-    async def async_set_temperature(self, **kwargs: Any) -> None:
-        """Set new target temperature."""
-        ble_device = get_ble_device_with_adapter(self.hass, self._mac_address, self._entry_id)
-        if not ble_device:
-            _LOGGER.error("Could not find BLE device")
-            return
+    def _target_hvac_mode(self) -> HVACMode:
+        """Return the mode new setpoints and fan settings apply to.
 
-        # Get the BLE lock to serialize operations
-        ble_lock = None
-        if self._entry_id in self.hass.data.get(DOMAIN, {}):
-            ble_lock = self.hass.data[DOMAIN][self._entry_id].get("ble_lock")
+        A mode change that is still queued or being sent takes precedence over
+        the last known state, so back to back calls write the keys of the new mode.
+        """
+        for changes in (self._pending_changes, self._sending_changes):
+            if "mode" in changes:
+                return EASY_MODE_TO_HA_MODE.get(changes["mode"], HVACMode.OFF)
+        return self.hvac_mode
 
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set new target temperature."""
         changes = {"zone": 0, "power": 1}
         if ATTR_TEMPERATURE in kwargs:
             temp = int(kwargs[ATTR_TEMPERATURE])
-            if self.hvac_mode == HVACMode.COOL:
+            hvac_mode = self._target_hvac_mode()
+            if hvac_mode == HVACMode.COOL:
                 changes["cool_sp"] = temp
-            elif self.hvac_mode == HVACMode.HEAT:
+            elif hvac_mode == HVACMode.HEAT:
                 changes["heat_sp"] = temp
-            elif self.hvac_mode == HVACMode.DRY:
+            elif hvac_mode == HVACMode.DRY:
                 changes["dry_sp"] = temp
         elif "target_temp_high" in kwargs and "target_temp_low" in kwargs:
             changes["autoCool_sp"] = int(kwargs["target_temp_high"])
             changes["autoHeat_sp"] = int(kwargs["target_temp_low"])
 
-        if changes:
-            message = {"Type": "Change", "Changes": changes}
-            success = await self._data.send_command(self.hass, ble_device, message, ble_lock)
-            if success:
-                # Immediately refresh state after successful command to update UI
-                # Wait a moment for device to process the change
-                await asyncio.sleep(1.0)
-                await self._async_fetch_initial_state()
+        self._queue_changes(changes)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
-        ble_device = get_ble_device_with_adapter(self.hass, self._mac_address, self._entry_id)
-        if not ble_device:
-            _LOGGER.error("Could not find BLE device")
-            return
-
-        # Get the BLE lock to serialize operations
-        ble_lock = None
-        if self._entry_id in self.hass.data.get(DOMAIN, {}):
-            ble_lock = self.hass.data[DOMAIN][self._entry_id].get("ble_lock")
-
         mode = HA_MODE_TO_EASY_MODE.get(hvac_mode)
         if mode is not None:
-            message = {
-                "Type": "Change",
-                "Changes": {
+            self._queue_changes(
+                {
                     "zone": 0,
                     "power": 0 if hvac_mode == HVACMode.OFF else 1,
                     "mode": mode,
-                },
-            }
-            success = await self._data.send_command(self.hass, ble_device, message, ble_lock)
-            if success:
-                # Immediately refresh state after successful command to update UI
-                # Wait a moment for device to process the change
-                await asyncio.sleep(1.0)
-                await self._async_fetch_initial_state()
+                }
+            )
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode using standard Home Assistant names."""
-        ble_device = get_ble_device_with_adapter(self.hass, self._mac_address, self._entry_id)
-        if not ble_device:
-            _LOGGER.error("Could not find BLE device")
-            return
-
-        # Get the BLE lock to serialize operations
-        ble_lock = None
-        if self._entry_id in self.hass.data.get(DOMAIN, {}):
-            ble_lock = self.hass.data[DOMAIN][self._entry_id].get("ble_lock")
-
+        hvac_mode = self._target_hvac_mode()
         # Map standard name to device value
-        if self.hvac_mode == HVACMode.FAN_ONLY:
+        if hvac_mode == HVACMode.FAN_ONLY:
             if fan_mode == "off":
                 fan_value = 0
             elif fan_mode == "low":
@@ -380,12 +378,7 @@ class MicroAirEasyTouchClimate(ClimateEntity):
                 fan_value = 2
             else:
                 fan_value = 0
-            message = {"Type": "Change", "Changes": {"zone": 0, "fanOnly": fan_value}}
-            success = await self._data.send_command(self.hass, ble_device, message, ble_lock)
-            if success:
-                # Immediately refresh state after successful command to update UI
-                await asyncio.sleep(1.0)
-                await self._async_fetch_initial_state()
+            self._queue_changes({"zone": 0, "fanOnly": fan_value})
         else:
             if fan_mode == "off":
                 fan_value = 0
@@ -398,18 +391,76 @@ class MicroAirEasyTouchClimate(ClimateEntity):
             else:
                 fan_value = 128
             changes = {"zone": 0}
-            if self.hvac_mode == HVACMode.COOL:
+            if hvac_mode == HVACMode.COOL:
                 changes["coolFan"] = fan_value
-            elif self.hvac_mode == HVACMode.HEAT:
+            elif hvac_mode == HVACMode.HEAT:
                 changes["heatFan"] = fan_value
-            elif self.hvac_mode == HVACMode.AUTO:
+            elif hvac_mode == HVACMode.AUTO:
                 changes["autoFan"] = fan_value
-            message = {"Type": "Change", "Changes": changes}
-            success = await self._data.send_command(self.hass, ble_device, message, ble_lock)
-            if success:
-                # Immediately refresh state after successful command to update UI
-                await asyncio.sleep(1.0)
-                await self._async_fetch_initial_state()
+            self._queue_changes(changes)
+
+    @callback
+    def _queue_changes(self, changes: dict[str, Any]) -> None:
+        """Queue changes for the device, merging calls made in quick succession."""
+        self._pending_changes.update(changes)
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+        self._flush_unsub = async_call_later(
+            self.hass, _COMMAND_COALESCE_DELAY, self._async_flush_pending
+        )
+
+    async def _async_flush_pending(self, _now: datetime) -> None:
+        """Send all queued changes to the device in a single command."""
+        self._flush_unsub = None
+        changes, self._pending_changes = self._pending_changes, {}
+        self._sending_changes = changes
+        try:
+            await self._async_send_changes(changes)
+        finally:
+            if self._sending_changes is changes:
+                self._sending_changes = {}
+
+    async def _async_send_changes(self, changes: dict[str, Any]) -> None:
+        """Send changes to the device and reflect them locally once accepted."""
+        ble_device = get_ble_device_with_adapter(self.hass, self._mac_address, self._data._entry_data)
+        if not ble_device:
+            _LOGGER.error("Could not find BLE device")
+            return
+
+        # Get the BLE lock to serialize operations
+        ble_lock = self._data._entry_data["ble_lock"]
+
+        message = {"Type": "Change", "Changes": changes}
+        success = await self._data.send_command(self.hass, ble_device, message, ble_lock)
+        if success:
+            # Show the accepted values right away; the next poll reconciles with the device
+            self._apply_changes(changes)
+            self.async_write_ha_state()
+
+    def _apply_changes(self, changes: dict[str, Any]) -> None:
+        """Reflect changes accepted by the device in the local state."""
+        state = dict(self._state)
+        for key, value in changes.items():
+            state_key = _CHANGE_TO_STATE_KEY.get(key)
+            if state_key is not None:
+                state[state_key] = value
+        if "mode" in changes:
+            state["mode_num"] = state["current_mode_num"] = changes["mode"]
+            # The device reports the matching mode names on the next poll
+            state.pop("mode", None)
+            state.pop("current_mode", None)
+        if changes.get("power") == 0:
+            state["current_mode_num"] = 0
+            state["off"] = True
+        elif changes.get("power") == 1:
+            state.pop("off", None)
+        self._apply_state(state)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending commands."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
 
     async def async_update(self) -> None:
         """Update the entity state manually if needed."""
@@ -0,0 +1,71 @@
+"""Helpers for MicroAirEasyTouch"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from bleak import BLEDevice
+from homeassistant.components.bluetooth import async_ble_device_from_address
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_ble_device_with_adapter(
+    hass: HomeAssistant, address: str, entry_data: dict[str, Any] | None = None
+) -> BLEDevice | None:
+    """
+    Get BLE device reference, preferring the adapter used during initial setup.
+    
+    This helps prevent disconnections when multiple Bluetooth adapters are available
+    by ensuring we use the same adapter that was used during setup.
+    
+    Args:
+        hass: Home Assistant instance
+        address: MAC address of the device
+        entry_data: Config entry data holding the stored adapter preference
+        
+    Returns:
+        BLEDevice if found, None otherwise
+    """
+    ble_device = async_ble_device_from_address(hass, address, connectable=True)
+    
+    if not ble_device:
+        return None
+    
+    device_adapter = ble_device.details.get("source")
+    # If we have the entry data, check if we should prefer a specific adapter
+    if entry_data is not None:
+        preferred_adapter = entry_data["adapter_source"]
+        if preferred_adapter:
+            if device_adapter != preferred_adapter:
+                _LOGGER.warning(
+                    "Device %s found on adapter %s, but preferred adapter is %s. "
+                    "This may cause connection issues. Using current adapter.",
+                    address,
+                    device_adapter,
+                    preferred_adapter,
+                )
+            elif _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Device %s found on preferred adapter: %s",
+                    address,
+                    device_adapter,
+                )
+        else:
+            # Store the adapter if we haven't stored it yet
+            entry_data["adapter_source"] = device_adapter
+            _LOGGER.info(
+                "Storing adapter %s for device %s",
+                device_adapter,
+                address,
+            )
+    else:
+        # Log which adapter we're using
+        _LOGGER.debug(
+            "Device %s found on adapter: %s",
+            address,
+            device_adapter,
+        )
+    
+    return ble_device
@@ -1,9 +1,28 @@
 """MicroAirEasyTouch module initialization"""
 from __future__ import annotations
 
-from .parser import MicroAirEasyTouchBluetoothDeviceData, MicroAirEasyTouchSensor
+from .parser import (
+    AUTO_COOL_SP,
+    AUTO_HEAT_SP,
+    COOL_SP,
+    CURRENT_MODE,
+    DRY_SP,
+    FACE_PLATE_TEMPERATURE,
+    FAN_MODE,
+    HEAT_SP,
+    MODE,
+    MicroAirEasyTouchBluetoothDeviceData,
+)
 
 __all__ = [
+    "AUTO_COOL_SP",
+    "AUTO_HEAT_SP",
+    "COOL_SP",
+    "CURRENT_MODE",
+    "DRY_SP",
+    "FACE_PLATE_TEMPERATURE",
+    "FAN_MODE",
+    "HEAT_SP",
+    "MODE",
     "MicroAirEasyTouchBluetoothDeviceData",
-    "MicroAirEasyTouchSensor",
-]
\ No newline at end of file
+]
@@ -2,71 +2,112 @@
 from __future__ import annotations
 import logging
 import asyncio
+import contextlib
 import time
 import json
+from functools import lru_cache
+from typing import Final
 
 # Bluetooth-related imports for device communication
 from bleak import BLEDevice
 from bleak.exc import BleakError, BleakDBusError
 from bleak_retry_connector import (
+    BLEAK_RETRY_EXCEPTIONS,
     BleakClientWithServiceCache,
+    BleakNotFoundError,
     establish_connection,
-    retry_bluetooth_connection_error,
 )
 
 from bluetooth_data_tools import short_address
 from bluetooth_sensor_state_data import BluetoothData
 from home_assistant_bluetooth import BluetoothServiceInfo
 from sensor_state_data import SensorDeviceClass, SensorUpdate, Units
-from sensor_state_data.enum import StrEnum
 
 from ..const import DOMAIN
 from .const import UUIDS
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson ships with Home Assistant, keep working without it
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
-from functools import wraps
-def retry_authentication(retries=3, delay=1):
-    """Custom retry decorator for authentication attempts."""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(retries):
-                try:
-                    result = await func(*args, **kwargs)
-                    if result:
-                        _LOGGER.debug("Authentication successful on attempt %d/%d", attempt + 1, retries)
-                        return True
-                    _LOGGER.debug("Authentication returned False on attempt %d/%d", attempt + 1, retries)
-                    if attempt < retries - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                except Exception as e:
-                    last_exception = e
-                    _LOGGER.debug("Authentication attempt %d/%d failed: %s", attempt + 1, retries, str(e))
-                    if attempt < retries - 1:
-                        await asyncio.sleep(delay)
-                        continue
-            if last_exception:
-                _LOGGER.error("Authentication failed after %d attempts: %s", retries, str(last_exception))
-            else:
-                _LOGGER.error("Authentication failed after %d attempts with no exception", retries)
-            return False
-        return wrapper
-    return decorator
-
-class MicroAirEasyTouchSensor(StrEnum):
-    """Enumeration of all available sensors for the MicroAir EasyTouch device."""
-    FACE_PLATE_TEMPERATURE = "face_plate_temperature"
-    CURRENT_MODE = "current_mode"
-    MODE = "mode"
-    FAN_MODE = "fan_mode"
-    AUTO_HEAT_SP = "autoHeat_sp"
-    AUTO_COOL_SP = "autoCool_sp"
-    COOL_SP = "cool_sp"
-    HEAT_SP = "heat_sp"
-    DRY_SP = "dry_sp"
+# Stand-in for the BLE lock when the caller already holds it (or passes none)
+_NO_LOCK = contextlib.nullcontext()
+
+# Authentication attempts and the pause between them
+_AUTH_ATTEMPTS = 3
+_AUTH_RETRY_DELAY = 2
+
+# Reset command, serialized once since it never changes
+_RESET_CMD_BYTES = b'{"Type":"Change","Changes":{"zone":0,"reset":" OK"}}'
+
+# Operation delay per failure count (failures are clamped to 3), capped at _MAX_DELAY
+_MAX_DELAY = 6.0
+_BACKOFF = tuple(min(0.5 * 2 ** n, _MAX_DELAY) for n in range(4))
+
+# Seconds a connection may sit unused before it is closed. Kept below the climate
+# SCAN_INTERVAL so the single connection the device allows is released between polls.
+_IDLE_DISCONNECT_TIMEOUT = 10.0
+
+# Connection attempts, each a single establish_connection attempt so errors can be inspected
+_CONNECT_ATTEMPTS = 3
+
+# BlueZ errors that another connection attempt cannot fix
+_PERMANENT_DBUS_ERRORS = frozenset({
+    "org.bluez.Error.DoesNotExist",
+    "org.bluez.Error.InvalidArguments",
+    "org.bluez.Error.NotPermitted",
+    "org.bluez.Error.NotSupported",
+})
+
+def _is_permanent_connect_error(err: BaseException) -> bool:
+    """Return True for connection errors that another attempt cannot fix.
+
+    establish_connection re-raises the underlying bleak error as one of its own
+    types, so the BlueZ error name is found on the cause.
+    """
+    cause = err if isinstance(err, BleakDBusError) else err.__cause__
+    if isinstance(cause, BleakDBusError):
+        return cause.dbus_error in _PERMANENT_DBUS_ERRORS
+    # Timeouts are reported as BleakNotFoundError as well, those are worth another try
+    return isinstance(err, BleakNotFoundError) and not isinstance(cause, asyncio.TimeoutError)
+
+# Successive waits for service discovery after connecting (about 3s in total)
+_SERVICES_WAIT = (0.1, 0.2, 0.4, 0.8, 1.5)
+
+@lru_cache(maxsize=64)
+def _short_addr(address: str) -> str:
+    """Return the short form of an address, cached since every advertisement needs it."""
+    return short_address(address)
+
+# Device mode and fan mode numbers as reported in the status payload
+_MODES = {0: "off", 5: "heat_on", 4: "heat", 3: "cool_on", 2: "cool", 1: "fan", 11: "auto"}
+_FAN_MODES_FULL = {0: "off", 1: "manualL", 2: "manualH", 65: "cycledL", 66: "cycledH", 128: "full auto"}
+_FAN_MODES_FAN_ONLY = {0: "off", 1: "low", 2: "high"}
+
+# Mode name -> (info index of its fan setting, fan mode table, status key, default name)
+_FAN_DISPATCH = {
+    "fan": (6, _FAN_MODES_FAN_ONLY, "fan_mode", "off"),
+    "cool": (7, _FAN_MODES_FULL, "cool_fan_mode", "full auto"),
+    "heat": (11, _FAN_MODES_FULL, "heat_fan_mode", "full auto"),
+    "auto": (9, _FAN_MODES_FULL, "auto_fan_mode", "full auto"),
+}
+
+# Status keys of the sensors exposed by the MicroAir EasyTouch device
+FACE_PLATE_TEMPERATURE: Final = "face_plate_temperature"
+CURRENT_MODE: Final = "current_mode"
+MODE: Final = "mode"
+FAN_MODE: Final = "fan_mode"
+AUTO_HEAT_SP: Final = "autoHeat_sp"
+AUTO_COOL_SP: Final = "autoCool_sp"
+COOL_SP: Final = "cool_sp"
+HEAT_SP: Final = "heat_sp"
+DRY_SP: Final = "dry_sp"
 
 class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
     """Main class for handling MicroAir EasyTouch device data and communication."""
@@ -77,72 +118,94 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
         self._password = password
         self._email = email
         self._client = None
-        self._max_delay = 6.0
         self._notification_task = None
+        # Operation delays as (address, operation) -> [delay, failures], shared through
+        # hass.data so they survive reloads
+        self._delays: dict[tuple[str, str], list] | None = None
+        # Config entry data (BLE lock, adapter preference) once set up by the integration
+        self._entry_data: dict | None = None
+        # Last decoded status payload, reused when the device reports the same bytes again
+        self._last_payload: bytes | None = None
+        self._last_status: dict | None = None
+        # Connections stay open between commands and are closed once idle
+        self._last_activity = 0.0
+        self._idle_timer: asyncio.TimerHandle | None = None
+        self._idle_task: asyncio.Task | None = None
+
+    def _get_delays_dict(self, hass) -> dict:
+        """Return the persistent delay storage, looking it up on first use."""
+        if self._delays is None:
+            self._delays = hass.data.setdefault(DOMAIN, {}).setdefault('device_delays', {})
+        return self._delays
 
     def _get_operation_delay(self, hass, address: str, operation: str) -> float:
         """Calculate delay for specific operations from persistent storage."""
-        device_delays = hass.data.setdefault(DOMAIN, {}).setdefault('device_delays', {}).get(address, {})
-        return device_delays.get(operation, {}).get('delay', 0.0)
+        current = self._get_delays_dict(hass).get((address, operation))
+        return current[0] if current is not None else 0.0
 
     def _increase_operation_delay(self, hass, address: str, operation: str) -> float:
         """Increase delay for specific operation and device with persistence."""
-        delays = hass.data.setdefault(DOMAIN, {}).setdefault('device_delays', {})
-        if address not in delays:
-            delays[address] = {}
-        if operation not in delays[address]:
-            delays[address][operation] = {'delay': 0.0, 'failures': 0}
-        current = delays[address][operation]
-        current['failures'] += 1
-        current['delay'] = min(0.5 * (2 ** min(current['failures'], 3)), self._max_delay)
-        _LOGGER.debug("Increased delay for %s:%s to %.1fs (failures: %d)", address, operation, current['delay'], current['failures'])
-        return current['delay']
+        delays = self._get_delays_dict(hass)
+        current = delays.get((address, operation))
+        if current is None:
+            current = delays[(address, operation)] = [0.0, 0]
+        current[1] += 1
+        current[0] = _BACKOFF[min(current[1], 3)]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Increased delay for %s:%s to %.1fs (failures: %d)", address, operation, current[0], current[1])
+        return current[0]
 
     def _adjust_operation_delay(self, hass, address: str, operation: str) -> None:
         """Adjust delay for specific operation after success, reducing gradually."""
-        delays = hass.data.setdefault(DOMAIN, {}).setdefault('device_delays', {})
-        if address in delays and operation in delays[address]:
-            current = delays[address][operation]
-            if current['failures'] > 0:
-                current['failures'] = max(0, current['failures'] - 1)
-                current['delay'] = max(0.0, current['delay'] * 0.75)
-                _LOGGER.debug("Adjusted delay for %s:%s to %.1fs (failures: %d)", address, operation, current['delay'], current['failures'])
-            if current['failures'] == 0 and current['delay'] < 0.1:
-                current['delay'] = 0.0
+        current = self._get_delays_dict(hass).get((address, operation))
+        if current is None:
+            return
+        if current[1] > 0:
+            current[1] -= 1
+            current[0] *= 0.75
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Adjusted delay for %s:%s to %.1fs (failures: %d)", address, operation, current[0], current[1])
+        if current[1] == 0 and 0.0 < current[0] < 0.1:
+            current[0] = 0.0
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("Reset delay for %s:%s to 0.0s", address, operation)
 
     def _start_update(self, service_info: BluetoothServiceInfo) -> None:
         """Update from BLE advertisement data."""
-        _LOGGER.debug("Parsing MicroAirEasyTouch BLE advertisement data: %s", service_info)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Parsing MicroAirEasyTouch BLE advertisement data: %s", service_info)
         self.set_device_manufacturer("MicroAirEasyTouch")
         self.set_device_type("Thermostat")
-        name = f"{service_info.name} {short_address(service_info.address)}"
+        name = f"{service_info.name} {_short_addr(service_info.address)}"
         self.set_device_name(name)
         self.set_title(name)
 
     def decrypt(self, data: bytes) -> dict:
-        """Parse and decode the device status data."""
-        status = json.loads(data)
+        """Parse and decode the device status data.
+
+        The returned dict is shared with later calls for the same payload and must not be modified.
+        """
+        if data == self._last_payload:
+            return self._last_status
+        status = _json_loads(data)
         info = status['Z_sts']['0']
         param = status['PRM']
-        modes = {0: "off", 5: "heat_on", 4: "heat", 3: "cool_on", 2: "cool", 1: "fan", 11: "auto"}
-        fan_modes_full = {0: "off", 1: "manualL", 2: "manualH", 65: "cycledL", 66: "cycledH", 128: "full auto"}
-        fan_modes_fan_only = {0: "off", 1: "low", 2: "high"}
-        hr_status = {}
-        hr_status['SN'] = status['SN']
-        hr_status['autoHeat_sp'] = info[0]
-        hr_status['autoCool_sp'] = info[1]
-        hr_status['cool_sp'] = info[2]
-        hr_status['heat_sp'] = info[3]
-        hr_status['dry_sp'] = info[4]
-        hr_status['fan_mode_num'] = info[6]  # Fan setting in fan-only mode
-        hr_status['cool_fan_mode_num'] = info[7]  # Fan setting in cool mode
-        hr_status['auto_fan_mode_num'] = info[9]  # Fan setting in auto mode
-        hr_status['mode_num'] = info[10]
-        hr_status['heat_fan_mode_num'] = info[11]  # Fan setting in heat mode
-        hr_status['facePlateTemperature'] = info[12]
-        hr_status['current_mode_num'] = info[15]
-        hr_status['ALL'] = status
+        hr_status = {
+            'SN': status['SN'],
+            'autoHeat_sp': info[0],
+            'autoCool_sp': info[1],
+            'cool_sp': info[2],
+            'heat_sp': info[3],
+            'dry_sp': info[4],
+            'fan_mode_num': info[6],  # Fan setting in fan-only mode
+            'cool_fan_mode_num': info[7],  # Fan setting in cool mode
+            'auto_fan_mode_num': info[9],  # Fan setting in auto mode
+            'mode_num': info[10],
+            'heat_fan_mode_num': info[11],  # Fan setting in heat mode
+            'facePlateTemperature': info[12],
+            'current_mode_num': info[15],
+            'ALL': status,
+        }
 
         if 7 in param:
             hr_status['off'] = True
@@ -150,136 +213,207 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
             hr_status['on'] = True
 
         # Map modes
-        if hr_status['current_mode_num'] in modes:
-            hr_status['current_mode'] = modes[hr_status['current_mode_num']]
-        if hr_status['mode_num'] in modes:
-            hr_status['mode'] = modes[hr_status['mode_num']]
-
-        # Map fan modes based on current mode
-        current_mode = hr_status.get('mode', "off")
-        
-        # Store the raw fan mode numbers and their string representations
-        if current_mode == "fan":
-            fan_num = info[6]
-            hr_status['fan_mode_num'] = fan_num
-            hr_status['fan_mode'] = fan_modes_fan_only.get(fan_num, "off")
-        elif current_mode == "cool":
-            fan_num = info[7]
-            hr_status['cool_fan_mode_num'] = fan_num
-            hr_status['cool_fan_mode'] = fan_modes_full.get(fan_num, "full auto")
-        elif current_mode == "heat":
-            fan_num = info[11]
-            hr_status['heat_fan_mode_num'] = fan_num
-            hr_status['heat_fan_mode'] = fan_modes_full.get(fan_num, "full auto")
-        elif current_mode == "auto":
-            fan_num = info[9]
-            hr_status['auto_fan_mode_num'] = fan_num
-            hr_status['auto_fan_mode'] = fan_modes_full.get(fan_num, "full auto")
+        if hr_status['current_mode_num'] in _MODES:
+            hr_status['current_mode'] = _MODES[hr_status['current_mode_num']]
+        if hr_status['mode_num'] in _MODES:
+            hr_status['mode'] = _MODES[hr_status['mode_num']]
 
+        # Map the fan setting of the current mode to its name
+        fan_dispatch = _FAN_DISPATCH.get(hr_status.get('mode', "off"))
+        if fan_dispatch is not None:
+            idx, table, key, default = fan_dispatch
+            hr_status[key] = table.get(info[idx], default)
+
+        self._last_payload = data
+        self._last_status = hr_status
         return hr_status
 
-    @retry_bluetooth_connection_error(attempts=7)
-    async def _connect_to_device_impl(self, ble_device: BLEDevice):
-        """Internal implementation of device connection."""
+    def _cancel_idle_timer(self) -> None:
+        """Stop the pending idle disconnect while an operation uses the connection."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _schedule_idle_disconnect(self) -> None:
+        """Record activity and close the connection if nothing else uses it in time."""
+        self._last_activity = time.monotonic()
+        self._cancel_idle_timer()
+        self._idle_timer = asyncio.get_running_loop().call_later(
+            _IDLE_DISCONNECT_TIMEOUT, self._on_idle_timeout
+        )
+
+    def _on_idle_timeout(self) -> None:
+        """Start the idle disconnect from the timer callback."""
+        self._idle_timer = None
+        self._idle_task = asyncio.get_running_loop().create_task(self._async_idle_disconnect())
+
+    async def _async_idle_disconnect(self) -> None:
+        """Disconnect unless an operation ran while waiting for the BLE lock."""
+        ble_lock = self._entry_data["ble_lock"] if self._entry_data else _NO_LOCK
+        async with ble_lock:
+            if self._idle_timer is not None or time.monotonic() - self._last_activity < _IDLE_DISCONNECT_TIMEOUT:
+                return
+            await self._disconnect_client()
+
+    async def _disconnect_client(self) -> None:
+        """Close the current connection, if any."""
+        client = self._client
         try:
-            self._client = await establish_connection(
-                BleakClientWithServiceCache,
-                ble_device,
-                ble_device.address,
-                timeout=20.0
-            )
-            if not self._client.services:
-                await asyncio.sleep(2)
-            if not self._client.services:
+            if client and client.is_connected:
+                await client.disconnect()
+        except Exception as e:
+            _LOGGER.debug("Error disconnecting: %s", str(e))
+        # Only forget the client once done, so a cancelled disconnect can be retried
+        self._client = None
+
+    async def disconnect(self) -> None:
+        """Close any open connection to the device, e.g. when the entry is unloaded."""
+        self._cancel_idle_timer()
+        # An idle disconnect that already started would otherwise outlive the entry
+        if self._idle_task is not None:
+            self._idle_task.cancel()
+            self._idle_task = None
+        ble_lock = self._entry_data["ble_lock"] if self._entry_data else _NO_LOCK
+        async with ble_lock:
+            await self._disconnect_client()
+
+    async def _connect_to_device(self, ble_device: BLEDevice):
+        """Connect to the device, retrying transient errors a bounded number of times."""
+        for attempt in range(_CONNECT_ATTEMPTS):
+            try:
+                # One attempt per call (establish_connection backs off before raising),
+                # so a permanent error is seen before the next attempt is made
+                client = self._client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    ble_device.address,
+                    max_attempts=1,
+                    timeout=20.0
+                )
+            except BLEAK_RETRY_EXCEPTIONS as e:
+                if attempt == _CONNECT_ATTEMPTS - 1 or _is_permanent_connect_error(e):
+                    _LOGGER.error("Connection error: %s", str(e))
+                    raise
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Connection attempt %d/%d failed: %s", attempt + 1, _CONNECT_ATTEMPTS, str(e))
+                continue
+            except Exception as e:
+                _LOGGER.error("Connection error: %s", str(e))
+                raise
+            # Return as soon as service discovery has resolved rather than always waiting
+            for wait in _SERVICES_WAIT:
+                if client.services:
+                    break
+                await asyncio.sleep(wait)
+            if not client.services:
                 _LOGGER.error("No services available after connecting")
                 return False
-            return self._client
-        except Exception as e:
-            _LOGGER.error("Connection error: %s", str(e))
-            raise
-    
-    async def _connect_to_device(self, ble_device: BLEDevice, ble_lock: asyncio.Lock | None = None):
-        """Connect to the device with retries."""
-        # Serialize connection attempts to prevent concurrent connections
-        if ble_lock:
-            async with ble_lock:
-                return await self._connect_to_device_impl(ble_device)
-        else:
-            return await self._connect_to_device_impl(ble_device)
+            return client
 
-    @retry_authentication(retries=3, delay=2)
     async def authenticate(self, password: str) -> bool:
-        """Authenticate with the device using the provided password."""
+        """Authenticate with the device, retrying a few times before giving up."""
+        last_exception = None
+        for attempt in range(_AUTH_ATTEMPTS):
+            try:
+                if await self._authenticate_once(password):
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Authentication successful on attempt %d/%d", attempt + 1, _AUTH_ATTEMPTS)
+                    return True
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Authentication returned False on attempt %d/%d", attempt + 1, _AUTH_ATTEMPTS)
+            except Exception as e:
+                last_exception = e
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Authentication attempt %d/%d failed: %s", attempt + 1, _AUTH_ATTEMPTS, str(e))
+            if attempt < _AUTH_ATTEMPTS - 1:
+                await asyncio.sleep(_AUTH_RETRY_DELAY)
+        if last_exception:
+            _LOGGER.error("Authentication failed after %d attempts: %s", _AUTH_ATTEMPTS, str(last_exception))
+        else:
+            _LOGGER.error("Authentication failed after %d attempts", _AUTH_ATTEMPTS)
+        return False
+
+    async def _authenticate_once(self, password: str) -> bool:
+        """Send the password once, connecting first if needed."""
         try:
-            if not self._client or not self._client.is_connected:
+            client = self._client
+            if not client or not client.is_connected:
                 await asyncio.sleep(1)
-                if not self._client or not self._client.is_connected:
+                client = self._client
+                if not client or not client.is_connected:
                     await self._connect_to_device(self._ble_device)
                     await asyncio.sleep(0.5)
-                if not self._client or not self._client.is_connected:
+                    client = self._client
+                if not client or not client.is_connected:
                     _LOGGER.error("Client not connected after reconnecting")
                     return False
-            if not self._client.services:
-                await self._client.discover_services()
+            if not client.services:
+                await client.discover_services()
                 await asyncio.sleep(1)
-                if not self._client.services:
+                if not client.services:
                     _LOGGER.error("Services not discovered")
                     return False
             password_bytes = password.encode('utf-8')
-            await self._client.write_gatt_char(UUIDS["passwordCmd"], password_bytes, response=True)
+            await client.write_gatt_char(UUIDS["passwordCmd"], password_bytes, response=True)
             _LOGGER.debug("Authentication sent successfully")
             return True
         except Exception as e:
             _LOGGER.error("Authentication failed: %s", str(e))
-            if self._client and self._client.is_connected:
-                await self._client.disconnect()
+            client = self._client
+            if client and client.is_connected:
+                await client.disconnect()
             self._client = None
             return False
 
+    async def _gatt_with_retry(self, hass, ble_device: BLEDevice, op_name: str, op, retries: int = 3, ble_lock: asyncio.Lock | None = None):
+        """Run a GATT operation with retry and adaptive delay, returning None on failure.
+
+        op is called with the connected client and returns the awaitable to run.
+        op_name selects the delay bucket ('read' or 'write') and labels the logs.
+        """
+        # Serialize GATT access to prevent concurrent operations
+        async with ble_lock or _NO_LOCK:
+            last_error = None
+            for attempt in range(retries):
+                try:
+                    client = self._client
+                    if not client or not client.is_connected:
+                        if not await self._reconnect_and_authenticate(hass, ble_device):
+                            return None
+                        client = self._client
+                    op_delay = self._get_operation_delay(hass, ble_device.address, op_name)
+                    if op_delay > 0:
+                        await asyncio.sleep(op_delay)
+                    result = await op(client)
+                    self._adjust_operation_delay(hass, ble_device.address, op_name)
+                    return result
+                except BleakError as e:
+                    last_error = e
+                    if attempt < retries - 1:
+                        delay = self._increase_operation_delay(hass, ble_device.address, op_name)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("GATT %s failed, attempt %d/%d. Delay: %.1f", op_name, attempt + 1, retries, delay)
+                        continue
+            _LOGGER.error("GATT %s failed after %d attempts: %s", op_name, retries, str(last_error))
+            return None
+
     async def _write_gatt_with_retry(self, hass, uuid: str, data: bytes, ble_device: BLEDevice, retries: int = 3, ble_lock: asyncio.Lock | None = None) -> bool:
         """Write GATT characteristic with retry and adaptive delay."""
-        # Serialize writes to prevent concurrent operations
-        if ble_lock:
-            async with ble_lock:
-                return await self._write_gatt_with_retry_impl(hass, uuid, data, ble_device, retries)
-        else:
-            return await self._write_gatt_with_retry_impl(hass, uuid, data, ble_device, retries)
-    
-    async def _write_gatt_with_retry_impl(self, hass, uuid: str, data: bytes, ble_device: BLEDevice, retries: int = 3) -> bool:
-        """Internal implementation of GATT write with retry."""
-        last_error = None
-        for attempt in range(retries):
-            try:
-                if not self._client or not self._client.is_connected:
-                    # Note: _reconnect_and_authenticate will handle its own locking
-                    if not await self._reconnect_and_authenticate(hass, ble_device, None):
-                        return False
-                write_delay = self._get_operation_delay(hass, ble_device.address, 'write')
-                if write_delay > 0:
-                    await asyncio.sleep(write_delay)
-                await self._client.write_gatt_char(uuid, data, response=True)
-                self._adjust_operation_delay(hass, ble_device.address, 'write')
-                return True
-            except BleakError as e:
-                last_error = e
-                if attempt < retries - 1:
-                    delay = self._increase_operation_delay(hass, ble_device.address, 'write')
-                    _LOGGER.debug("GATT write failed, attempt %d/%d. Delay: %.1f", attempt + 1, retries, delay)
-                    continue
-        _LOGGER.error("GATT write failed after %d attempts: %s", retries, str(last_error))
-        return False
+        async def _write(client) -> bool:
+            await client.write_gatt_char(uuid, data, response=True)
+            return True
 
-    async def _reconnect_and_authenticate(self, hass, ble_device: BLEDevice, ble_lock: asyncio.Lock | None = None) -> bool:
+        return await self._gatt_with_retry(hass, ble_device, 'write', _write, retries, ble_lock) is not None
+
+    async def _reconnect_and_authenticate(self, hass, ble_device: BLEDevice) -> bool:
         """Reconnect and re-authenticate with adaptive delays."""
         # Note: This is called from within locked contexts, so we don't lock again here
-        # The lock is passed through to _connect_to_device which handles it
         try:
             connect_delay = self._get_operation_delay(hass, ble_device.address, 'connect')
             if connect_delay > 0:
                 await asyncio.sleep(connect_delay)
-            # Pass None for lock since we're already in a locked context if called from locked method
-            self._client = await self._connect_to_device_impl(ble_device)
-            if not self._client or not self._client.is_connected:
+            client = self._client = await self._connect_to_device(ble_device)
+            if not client or not client.is_connected:
                 self._increase_operation_delay(hass, ble_device.address, 'connect')
                 return False
             self._adjust_operation_delay(hass, ble_device.address, 'connect')
@@ -299,176 +433,127 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
 
     async def _read_gatt_with_retry(self, hass, characteristic, ble_device: BLEDevice, retries: int = 3, ble_lock: asyncio.Lock | None = None) -> bytes | None:
         """Read GATT characteristic with retry and operation-specific delay."""
-        # Serialize reads to prevent concurrent operations
-        if ble_lock:
-            async with ble_lock:
-                return await self._read_gatt_with_retry_impl(hass, characteristic, ble_device, retries)
-        else:
-            return await self._read_gatt_with_retry_impl(hass, characteristic, ble_device, retries)
-    
-    async def _read_gatt_with_retry_impl(self, hass, characteristic, ble_device: BLEDevice, retries: int = 3) -> bytes | None:
-        """Internal implementation of GATT read with retry."""
-        last_error = None
-        for attempt in range(retries):
-            try:
-                if not self._client or not self._client.is_connected:
-                    # Note: _reconnect_and_authenticate will handle its own locking
-                    if not await self._reconnect_and_authenticate(hass, ble_device, None):
-                        return None
-                read_delay = self._get_operation_delay(hass, ble_device.address, 'read')
-                if read_delay > 0:
-                    await asyncio.sleep(read_delay)
-                result = await self._client.read_gatt_char(characteristic)
-                self._adjust_operation_delay(hass, ble_device.address, 'read')
-                return result
-            except BleakError as e:
-                last_error = e
-                if attempt < retries - 1:
-                    delay = self._increase_operation_delay(hass, ble_device.address, 'read')
-                    _LOGGER.debug("GATT read failed, attempt %d/%d. Delay: %.1f", attempt + 1, retries, delay)
-                    continue
-        _LOGGER.error("GATT read failed after %d attempts: %s", retries, str(last_error))
-        return None
+        return await self._gatt_with_retry(
+            hass, ble_device, 'read', lambda client: client.read_gatt_char(characteristic), retries, ble_lock
+        )
+
+    async def _ensure_connected(self, ble_device: BLEDevice) -> bool:
+        """Connect and authenticate unless the current connection is still up.
+
+        A connection is only kept after it authenticated and its last operation
+        succeeded, so a live one needs no new password write.
+        """
+        client = self._client
+        if client and client.is_connected:
+            return True
+        client = self._client = await self._connect_to_device(ble_device)
+        if not client or not client.is_connected:
+            return False
+        return await self.authenticate(self._password)
 
     async def reboot_device(self, hass, ble_device: BLEDevice, ble_lock: asyncio.Lock | None = None) -> bool:
         """Reboot the device by sending reset command."""
         # Serialize reboot to prevent concurrent operations
-        if ble_lock:
-            async with ble_lock:
-                return await self._reboot_device_impl(hass, ble_device)
-        else:
-            return await self._reboot_device_impl(hass, ble_device)
-    
-    async def _reboot_device_impl(self, hass, ble_device: BLEDevice) -> bool:
-        """Internal implementation of device reboot."""
-        try:
-            self._ble_device = ble_device
-            self._client = await self._connect_to_device_impl(ble_device)
-            if not self._client or not self._client.is_connected:
-                _LOGGER.error("Failed to connect for reboot")
-                return False
-            if not await self.authenticate(self._password):
-                _LOGGER.error("Failed to authenticate for reboot")
-                return False
-            write_delay = self._get_operation_delay(hass, ble_device.address, 'write')
-            if write_delay > 0:
-                await asyncio.sleep(write_delay)
-            reset_cmd = {"Type": "Change", "Changes": {"zone": 0, "reset": " OK"}}
-            cmd_bytes = json.dumps(reset_cmd).encode()
+        async with ble_lock or _NO_LOCK:
+            self._cancel_idle_timer()
             try:
-                await self._client.write_gatt_char(UUIDS["jsonCmd"], cmd_bytes, response=True)
-                _LOGGER.info("Reboot command sent successfully")
-                return True
-            except BleakError as e:
-                if "Error" in str(e) and "133" in str(e):
-                    _LOGGER.info("Device is rebooting as expected")
+                self._ble_device = ble_device
+                if not await self._ensure_connected(ble_device):
+                    _LOGGER.error("Failed to connect and authenticate for reboot")
+                    return False
+                write_delay = self._get_operation_delay(hass, ble_device.address, 'write')
+                if write_delay > 0:
+                    await asyncio.sleep(write_delay)
+                try:
+                    await self._client.write_gatt_char(UUIDS["jsonCmd"], _RESET_CMD_BYTES, response=True)
+                    _LOGGER.info("Reboot command sent successfully")
                     return True
-                _LOGGER.error("Failed to send reboot command: %s", str(e))
-                self._increase_operation_delay(hass, ble_device.address, 'write')
-                return False
-        except Exception as e:
-            _LOGGER.error("Error during reboot: %s", str(e))
-            return False
-        finally:
-            try:
-                if self._client and self._client.is_connected:
-                    await self._client.disconnect()
+                except BleakError as e:
+                    msg = str(e)
+                    # GATT error 133: the device dropped the link because it is rebooting
+                    if "133" in msg and "Error" in msg:
+                        _LOGGER.info("Device is rebooting as expected")
+                        return True
+                    _LOGGER.error("Failed to send reboot command: %s", msg)
+                    self._increase_operation_delay(hass, ble_device.address, 'write')
+                    return False
             except Exception as e:
-                _LOGGER.debug("Error disconnecting after reboot: %s", str(e))
-            self._client = None
-            self._ble_device = None
+                _LOGGER.error("Error during reboot: %s", str(e))
+                return False
+            finally:
+                await self._disconnect_client()
+                self._ble_device = None
 
     async def send_command(self, hass, ble_device: BLEDevice, command: dict, ble_lock: asyncio.Lock | None = None) -> bool:
         """Send command to device."""
         # Serialize command sending to prevent concurrent operations
-        if ble_lock:
-            async with ble_lock:
-                return await self._send_command_impl(hass, ble_device, command)
-        else:
-            return await self._send_command_impl(hass, ble_device, command)
-    
-    async def _send_command_impl(self, hass, ble_device: BLEDevice, command: dict) -> bool:
-        """Internal implementation of command sending."""
-        try:
-            if not self._client or not self._client.is_connected:
-                self._client = await self._connect_to_device_impl(ble_device)
-                if not self._client or not self._client.is_connected:
-                    return False
-                if not await self.authenticate(self._password):
-                    return False
-            command_bytes = json.dumps(command).encode()
-            # Pass None for lock since we're already in a locked context
-            return await self._write_gatt_with_retry_impl(hass, UUIDS["jsonCmd"], command_bytes, ble_device)
-        except Exception as e:
-            _LOGGER.error("Error sending command: %s", str(e))
-            return False
-        finally:
+        async with ble_lock or _NO_LOCK:
+            self._cancel_idle_timer()
+            success = False
             try:
-                if self._client and self._client.is_connected:
-                    await self._client.disconnect()
+                if not await self._ensure_connected(ble_device):
+                    return False
+                command_bytes = _json_dumps(command)
+                # No lock here since we're already in a locked context
+                success = await self._write_gatt_with_retry(hass, UUIDS["jsonCmd"], command_bytes, ble_device)
+                return success
             except Exception as e:
-                _LOGGER.debug("Error disconnecting: %s", str(e))
-            self._client = None
-    
+                _LOGGER.error("Error sending command: %s", str(e))
+                return False
+            finally:
+                # Keep a healthy connection for the next command, drop it after a failure
+                if success:
+                    self._schedule_idle_disconnect()
+                else:
+                    await self._disconnect_client()
+
     async def send_command_and_read(
         self, hass, ble_device: BLEDevice, command: dict, read_uuid: str, ble_lock: asyncio.Lock | None = None
     ) -> bytes | None:
         """
         Send command and read response in a single connection.
         This is more efficient than send_command() followed by _read_gatt_with_retry()
-        as it avoids disconnecting and reconnecting.
+        as it avoids disconnecting and reconnecting. The connection is kept open
+        afterwards until it has been idle for _IDLE_DISCONNECT_TIMEOUT seconds.
         """
         # Serialize operations to prevent concurrent access
-        if ble_lock:
-            async with ble_lock:
-                return await self._send_command_and_read_impl(hass, ble_device, command, read_uuid)
-        else:
-            return await self._send_command_and_read_impl(hass, ble_device, command, read_uuid)
-    
-    async def _send_command_and_read_impl(
-        self, hass, ble_device: BLEDevice, command: dict, read_uuid: str
-    ) -> bytes | None:
-        """Internal implementation of send command and read."""
-        try:
-            # Connect if needed
-            if not self._client or not self._client.is_connected:
-                self._client = await self._connect_to_device_impl(ble_device)
-                if not self._client or not self._client.is_connected:
+        async with ble_lock or _NO_LOCK:
+            self._cancel_idle_timer()
+            result = None
+            try:
+                # Connect if needed
+                if not await self._ensure_connected(ble_device):
                     return None
-                if not await self.authenticate(self._password):
+                
+                # Send command
+                command_bytes = _json_dumps(command)
+                write_success = await self._write_gatt_with_retry(hass, UUIDS["jsonCmd"], command_bytes, ble_device)
+                if not write_success:
                     return None
-            
-            # Send command
-            command_bytes = json.dumps(command).encode()
-            write_success = await self._write_gatt_with_retry_impl(hass, UUIDS["jsonCmd"], command_bytes, ble_device)
-            if not write_success:
-                return None
-            
-            # Small delay to allow device to process
-            await asyncio.sleep(0.5)
-            
-            # Read response (reuse existing connection)
-            read_delay = self._get_operation_delay(hass, ble_device.address, 'read')
-            if read_delay > 0:
-                await asyncio.sleep(read_delay)
-            
-            try:
-                result = await self._client.read_gatt_char(read_uuid)
-                self._adjust_operation_delay(hass, ble_device.address, 'read')
-                return result
-            except BleakError as e:
-                _LOGGER.debug("GATT read failed: %s", str(e))
-                self._increase_operation_delay(hass, ble_device.address, 'read')
-                return None
                 
-        except Exception as e:
-            _LOGGER.error("Error in send_command_and_read: %s", str(e))
-            return None
-        finally:
-            # Disconnect after both operations complete
-            try:
-                if self._client and self._client.is_connected:
-                    await self._client.disconnect()
+                # Small delay to allow device to process
+                await asyncio.sleep(0.5)
+                
+                # Read response (reuse existing connection)
+                read_delay = self._get_operation_delay(hass, ble_device.address, 'read')
+                if read_delay > 0:
+                    await asyncio.sleep(read_delay)
+                
+                try:
+                    result = await self._client.read_gatt_char(read_uuid)
+                    self._adjust_operation_delay(hass, ble_device.address, 'read')
+                    return result
+                except BleakError as e:
+                    _LOGGER.debug("GATT read failed: %s", str(e))
+                    self._increase_operation_delay(hass, ble_device.address, 'read')
+                    return None
+                    
             except Exception as e:
-                _LOGGER.debug("Error disconnecting: %s", str(e))
-            self._client = None
\ No newline at end of file
+                _LOGGER.error("Error in send_command_and_read: %s", str(e))
+                return None
+            finally:
+                # Keep a healthy connection for the next poll, drop it after a failure
+                if result is not None:
+                    self._schedule_idle_disconnect()
+                else:
+                    await self._disconnect_client()
\ No newline at end of file
@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 import homeassistant.helpers.config_validation as cv
 
 from .const import DOMAIN
-from . import get_ble_device_with_adapter
+from .helpers import get_ble_device_with_adapter
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,6 +25,10 @@ SERVICE_SET_LOCATION_SCHEMA = vol.Schema(
 
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register services for the MicroAirEasyTouch integration."""
+    # Services are shared by all config entries, register them only once
+    if hass.services.has_service(DOMAIN, "set_location"):
+        return
+
     async def handle_set_location(call: ServiceCall) -> None:
         """Handle the set_location service call."""
         address = call.data.get("address")
@@ -48,15 +52,13 @@ async def async_register_services(hass: HomeAssistant) -> None:
         assert mac_address is not None
 
         # Get BLE device with adapter preference
-        ble_device = get_ble_device_with_adapter(hass, mac_address, config_entry.entry_id)
+        ble_device = get_ble_device_with_adapter(hass, mac_address, device_data._entry_data)
         if not ble_device:
             _LOGGER.error("Could not find BLE device for address %s", mac_address)
             return
 
         # Get the BLE lock to serialize operations
-        ble_lock = None
-        if config_entry.entry_id in hass.data.get(DOMAIN, {}):
-            ble_lock = hass.data[DOMAIN][config_entry.entry_id].get("ble_lock")
+        ble_lock = device_data._entry_data["ble_lock"]
 
         # Construct the command
         command = {